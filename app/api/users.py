@@ -1,16 +1,22 @@
-from app.auth.dependencies import check_permission, get_db, get_current_user
+from app.auth.dependencies import WEBSOCKET_AUTH_SUBPROTOCOL, check_permission, get_db, get_current_user, get_websocket_user
 from app.core.database import SessionLocal
+from app.core.events import change_hub
+from app.core.user_index import user_index
 from app.crud import user as crud_user
 from app.models.role import Role
 from app.models.user import User
-from app.schemas.user import UserCreate, UserReadDetails, UserReadList, UserUpdate, UserSelfUpdate
+from app.schemas.user import UserCreate, UserReadDetails, UserReadList, UserUpdate, UserSelfUpdate, UserSuggestion
+from app.utils.emails.validation import check_domains_deliverable, deliverability_enabled, email_domain
 from app.utils.emails.welcome import send_welcome_email
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from anyio import from_thread
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from uuid import UUID, uuid4
+import asyncio
 import os
+import time
 
 class PaginatedUserListResponse(BaseModel):
     data: List[UserReadList]
@@ -40,6 +46,18 @@ def ensure_email_unique(db: Session, email: str, exclude_user_id: UUID = None) -
             detail={"errors": {"email": "Email already registered"}}
         )
 
+def ensure_emails_deliverable(emails: List[str]) -> None:
+    # Endpoints run in the threadpool, so the async DNS lookups are handed back
+    # to the event loop instead of blocking it from inside request validation.
+    if not deliverability_enabled() or not emails:
+        return
+    undeliverable = from_thread.run(check_domains_deliverable, [email_domain(e) for e in emails])
+    if undeliverable:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={"errors": {"email": "Email domain does not accept mail"}}
+        )
+
 @router.post("/", response_model=UserReadDetails)
 def create_user(
     user: UserCreate, 
@@ -52,6 +70,7 @@ def create_user(
     
     ensure_role_exists(db, user.role_id)
     ensure_email_unique(db, user.email)
+    ensure_emails_deliverable([user.email])
     
     verification_token = str(uuid4())
     verification_link = f"{os.getenv('CLIENT_APP_HOST')}/change-password/{verification_token}"
@@ -79,6 +98,7 @@ def update_current_user(
 
     if user_data.email and user_data.email != db_user.email:
         ensure_email_unique(db, user_data.email, exclude_user_id=db_user.id)
+        ensure_emails_deliverable([user_data.email])
 
     updated_user = crud_user.update_user(db, db_user, user_data)
     return updated_user
@@ -103,6 +123,8 @@ def update_user(
 
     if user_data.email:
         ensure_email_unique(db, user_data.email, exclude_user_id=user_id)
+        if user_data.email != db_user.email:
+            ensure_emails_deliverable([user_data.email])
 
     if user_data.role_id:
         ensure_role_exists(db, user_data.role_id)
@@ -114,6 +136,79 @@ def update_user(
 def get_profile(current_user: User = Depends(get_current_user)):
     return current_user
 
+@router.get("/suggest", response_model=List[UserSuggestion])
+def suggest_users(
+    q: str = Query(..., min_length=1, description="Prefix of an email or name"),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user)
+):
+    view_own = check_permission(current_user, name="viewOwn:users")
+
+    if not (
+        check_permission(current_user, name="view:users") or view_own
+    ):
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+
+    return user_index.suggest(q, limit=limit, user_id=current_user.id if view_own else None)
+
+@router.websocket("/changes")
+async def user_changes(websocket: WebSocket, current_user: User = Depends(get_websocket_user)):
+    view_own = check_permission(current_user, name="viewOwn:users")
+
+    if not (
+        check_permission(current_user, name="view:users") or view_own
+    ):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Insufficient permissions")
+        return
+
+    await websocket.accept(subprotocol=WEBSOCKET_AUTH_SUBPROTOCOL)
+    subscriber = change_hub.subscribe(
+        current_user.id,
+        view_all=not view_own,
+        role_id=current_user.role_id,
+        status=getattr(current_user.status, "value", current_user.status),
+        expires_at=websocket.state.token_expires_at,
+    )
+
+    async def watch_disconnect():
+        # Incoming frames are ignored; receive() is used rather than
+        # iter_text() so binary frames don't end the feed.
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+        except Exception:
+            pass
+        finally:
+            subscriber.close()
+
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        while True:
+            timeout = None
+            if subscriber.expires_at is not None:
+                timeout = subscriber.expires_at - time.time()
+            try:
+                event = await asyncio.wait_for(subscriber.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                subscriber.close(status.WS_1008_POLICY_VIOLATION, "Token expired")
+                event = None
+            if event is None:
+                break
+            await websocket.send_json(event)
+        if subscriber.close_code is not None:
+            await websocket.close(code=subscriber.close_code, reason=subscriber.close_reason)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        change_hub.unsubscribe(subscriber)
+        watcher.cancel()
+        try:
+            await watcher
+        except asyncio.CancelledError:
+            pass
+
 @router.get("/{user_id}", response_model=UserReadDetails)
 def read_user(
     user_id: UUID, 
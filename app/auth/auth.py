@@ -1,11 +1,13 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
+from app.core.events import change_hub, user_event
+from app.crud import user as crud_user
 from app.models.user import User
 from app.auth.security import verify_password, hash_password, create_access_token
 from uuid import UUID
 
 def authenticate_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(User.email == email, User.status == 'ACTIVE').first()
+    user = crud_user.get_active_user_by_email(db, email)
     if not user or not verify_password(password, user.password or ""):
         raise HTTPException(status_code=400, detail="Invalid credentials")
     return user
@@ -39,6 +41,7 @@ def change_user_password_with_token(db: Session, change_password_token: str, new
     
     db.commit()
     db.refresh(user)
+    change_hub.publish(user_event("updated", user))
     
     access_token = create_access_token({"sub": str(user.id)})
     return access_token
@@ -1,7 +1,8 @@
 from app.auth.security import decode_access_token
 from app.core.database import SessionLocal
+from app.crud import user as crud_user
 from app.models.user import User
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, WebSocket, WebSocketException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from sqlalchemy.orm import Session
@@ -26,12 +27,41 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid authentication")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = crud_user.get_user(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     return user
 
+WEBSOCKET_AUTH_SUBPROTOCOL = "bearer"
+
+def get_websocket_user(websocket: WebSocket) -> User:
+    # Browsers cannot set headers on a WebSocket handshake, so clients offer
+    # the subprotocols ["bearer", <token>]. Unlike a query string, this header
+    # is not written to the access log. The session is closed here rather
+    # than held open for the lifetime of the connection.
+    protocols = [p.strip() for p in websocket.headers.get("sec-websocket-protocol", "").split(",")]
+    token = None
+    if len(protocols) == 2 and protocols[0] == WEBSOCKET_AUTH_SUBPROTOCOL:
+        token = protocols[1]
+
+    payload = decode_access_token(token) if token else None
+    user_id = payload.get("sub") if payload else None
+    if not user_id:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid authentication")
+
+    websocket.state.token_expires_at = payload.get("exp")
+
+    db = SessionLocal()
+    try:
+        user = crud_user.get_user(db, user_id)
+        if not user:
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="User not found")
+        user.role  # load the role before the session closes
+        return user
+    finally:
+        db.close()
+
 def check_permission(
     user: User,
     *,
@@ -0,0 +1,118 @@
+from fastapi import status
+from threading import Lock
+from typing import Optional, Set
+from uuid import UUID
+import asyncio
+import os
+
+CHANGE_FEED_QUEUE_SIZE = int(os.getenv("CHANGE_FEED_QUEUE_SIZE", "100"))
+
+class Subscriber:
+    def __init__(self, user_id: UUID, view_all: bool, queue_size: int,
+                 role_id: Optional[UUID] = None, status: Optional[str] = None,
+                 expires_at: Optional[float] = None):
+        self.user_id = str(user_id)
+        self.view_all = view_all
+        self.role_id = str(role_id) if role_id is not None else None
+        self.status = status
+        self.expires_at = expires_at
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.close_code: Optional[int] = None
+        self.close_reason: Optional[str] = None
+        self.closed = False
+
+    def accepts(self, event: dict) -> bool:
+        return self.view_all or event.get("id") == self.user_id
+
+    def revokes(self, event: dict) -> bool:
+        # Any change to the subscriber's own account that could affect what
+        # they may see ends the feed; the client re-authenticates on reconnect.
+        if event.get("id") != self.user_id:
+            return False
+        if event.get("action") == "deleted":
+            return True
+        return event.get("role_id") != self.role_id or event.get("status") != self.status
+
+    def close(self, code: Optional[int] = None, reason: Optional[str] = None) -> None:
+        # The first close wins; a None code means the client went away.
+        if self.closed:
+            return
+        self.closed = True
+        self.close_code = code
+        self.close_reason = reason
+        # Make room for the sentinel so the sender loop always wakes up.
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+class ChangeHub:
+    """Per-process fan-out of change events to WebSocket subscribers.
+
+    Events are published from the CRUD layer, which runs in the threadpool,
+    and handed to the event loop that owns the subscriber queues. A client
+    whose queue is full is dropped rather than buffered without bound, and
+    one whose own account is deleted or changes role or status is closed.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscriber] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = Lock()
+
+    def subscribe(self, user_id: UUID, view_all: bool, role_id: Optional[UUID] = None,
+                  status: Optional[str] = None, expires_at: Optional[float] = None) -> Subscriber:
+        subscriber = Subscriber(user_id, view_all, self.queue_size, role_id, status, expires_at)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event: dict) -> None:
+        with self._lock:
+            loop = self._loop
+            if loop is None or not self._subscribers:
+                return
+        try:
+            loop.call_soon_threadsafe(self._dispatch, event)
+        except RuntimeError:
+            # The loop has been closed, e.g. during shutdown.
+            pass
+
+    def _dispatch(self, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.closed:
+                continue
+            if subscriber.revokes(event):
+                self.unsubscribe(subscriber)
+                subscriber.close(status.WS_1008_POLICY_VIOLATION, "Permissions changed")
+                continue
+            if not subscriber.accepts(event):
+                continue
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.unsubscribe(subscriber)
+                subscriber.close(status.WS_1013_TRY_AGAIN_LATER, "Client too slow")
+
+change_hub = ChangeHub(CHANGE_FEED_QUEUE_SIZE)
+
+def user_event(action: str, user) -> dict:
+    return {
+        "entity": "user",
+        "action": action,
+        "id": str(user.id),
+        "email": user.email,
+        "fullname": user.fullname,
+        "status": getattr(user.status, "value", user.status),
+        "role_id": str(user.role_id),
+    }
+
+def user_deleted_event(user_id: UUID) -> dict:
+    return {"entity": "user", "action": "deleted", "id": str(user_id)}
@@ -0,0 +1,111 @@
+from app.models.user import User
+from bisect import bisect_left
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+import os
+
+USER_INDEX_BATCH_SIZE = 1000
+USER_INDEX_REFRESH_SECONDS = float(os.getenv("USER_INDEX_REFRESH_SECONDS", "60"))
+
+def _index_keys(email: str, fullname: str) -> List[str]:
+    # The whole email and name, plus each later word of the name so that
+    # "smi" finds "John Smith".
+    email = (email or "").lower()
+    fullname = (fullname or "").lower()
+    keys = {email, fullname}
+    keys.update(fullname.split()[1:])
+    keys.discard("")
+    return sorted(keys)
+
+class UserPrefixIndex:
+    """In-process prefix index over user emails and names.
+
+    Keys live in one sorted list with a parallel list of user ids, so a
+    lookup is a binary search followed by a short forward scan. The index
+    is per process: writes made here apply immediately, and writes from
+    other workers show up on the next periodic rebuild.
+    """
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._ids: List[str] = []
+        self._users: Dict[str, Tuple[str, str]] = {}
+        self._lock = Lock()
+
+    def build(self, db: Session) -> None:
+        entries = []
+        users = {}
+        stmt = select(User.id, User.email, User.fullname).execution_options(yield_per=USER_INDEX_BATCH_SIZE)
+        for user_id, email, fullname in db.execute(stmt):
+            user_id = str(user_id)
+            users[user_id] = (email, fullname)
+            entries.extend((key, user_id) for key in _index_keys(email, fullname))
+        entries.sort()
+
+        with self._lock:
+            self._keys = [key for key, _ in entries]
+            self._ids = [user_id for _, user_id in entries]
+            self._users = users
+
+    def upsert(self, user_id: UUID, email: str, fullname: str) -> None:
+        user_id = str(user_id)
+        with self._lock:
+            self._remove_locked(user_id)
+            self._users[user_id] = (email, fullname)
+            for key in _index_keys(email, fullname):
+                pos = bisect_left(self._keys, key)
+                self._keys.insert(pos, key)
+                self._ids.insert(pos, user_id)
+
+    def remove(self, user_id: UUID) -> None:
+        with self._lock:
+            self._remove_locked(str(user_id))
+
+    def _remove_locked(self, user_id: str) -> None:
+        record = self._users.pop(user_id, None)
+        if record is None:
+            return
+        for key in _index_keys(*record):
+            pos = bisect_left(self._keys, key)
+            while pos < len(self._keys) and self._keys[pos] == key:
+                if self._ids[pos] == user_id:
+                    del self._keys[pos]
+                    del self._ids[pos]
+                    break
+                pos += 1
+
+    def suggest(self, prefix: str, limit: int = 10, user_id: Optional[UUID] = None) -> List[dict]:
+        """Return up to ``limit`` users whose email or name starts with ``prefix``.
+
+        When ``user_id`` is given only that user can match.
+        """
+        prefix = prefix.strip().lower()
+        if not prefix or limit <= 0:
+            return []
+
+        results = []
+        seen = set()
+        with self._lock:
+            if user_id:
+                record = self._users.get(str(user_id))
+                if record and any(key.startswith(prefix) for key in _index_keys(*record)):
+                    results.append({"id": str(user_id), "email": record[0], "fullname": record[1]})
+                return results
+
+            pos = bisect_left(self._keys, prefix)
+            while pos < len(self._keys) and self._keys[pos].startswith(prefix):
+                match_id = self._ids[pos]
+                pos += 1
+                if match_id in seen:
+                    continue
+                seen.add(match_id)
+                email, fullname = self._users[match_id]
+                results.append({"id": match_id, "email": email, "fullname": fullname})
+                if len(results) >= limit:
+                    break
+        return results
+
+user_index = UserPrefixIndex()
@@ -1,10 +1,11 @@
+from app.core.events import change_hub, user_deleted_event, user_event
+from app.core.user_index import user_index
 from app.models.role import Role
-from app.models.user import User
-from app.models.user import User
+from app.models.user import User, UserStatus
 from app.schemas.user import UserCreate, UserUpdate
 from datetime import datetime
-from datetime import datetime
-from sqlalchemy import or_, func, String, asc, desc
+from functools import lru_cache
+from sqlalchemy import bindparam, or_, func, select, Integer, String, asc, desc
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
@@ -14,6 +15,8 @@ def create_user(db: Session, user: UserCreate, change_password_token: str) -> Us
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    user_index.upsert(db_user.id, db_user.email, db_user.fullname)
+    change_hub.publish(user_event("created", db_user))
     return db_user
 
 def update_user(db: Session, db_user: User, user_data: UserUpdate) -> User:
@@ -23,11 +26,65 @@ def update_user(db: Session, db_user: User, user_data: UserUpdate) -> User:
     db_user.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(db_user)
+    user_index.upsert(db_user.id, db_user.email, db_user.fullname)
+    change_hub.publish(user_event("updated", db_user))
     return db_user
 
 
+# Hot lookups are built once with bound parameters so each call skips
+# statement construction and hits the engine's compiled cache directly.
+_user_by_id_stmt = select(User).where(User.id == bindparam("user_id"))
+
+_active_user_by_email_stmt = select(User).where(
+    User.email == bindparam("email"),
+    User.status == UserStatus.ACTIVE,
+)
+
+_sort_fields = {
+    "fullname": User.fullname,
+    "email": User.email,
+    "created_at": User.created_at,
+    "joined_at": User.joined_at,
+    "status": User.status,
+    "role": Role.title,
+}
+
 def get_user(db: Session, user_id: UUID) -> User:
-    return db.query(User).filter(User.id == user_id).first()
+    return db.scalars(_user_by_id_stmt, {"user_id": user_id}).first()
+
+def get_active_user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.scalars(_active_user_by_email_stmt, {"email": email}).first()
+
+@lru_cache(maxsize=None)
+def _users_list_stmts(has_search: bool, has_user_id: bool, sort_by: str, ascending: bool):
+    criteria = []
+
+    if has_user_id:
+        criteria.append(User.id == bindparam("user_id"))
+
+    if has_search:
+        ilike_value = func.lower(bindparam("search", type_=String))
+        criteria.append(
+            or_(
+                func.lower(User.email).ilike(ilike_value),
+                func.lower(User.fullname).ilike(ilike_value),
+                func.lower(Role.title).ilike(ilike_value),
+                func.lower(User.status.cast(String)).ilike(ilike_value),
+            )
+        )
+
+    count_stmt = select(func.count()).select_from(User).join(User.role).where(*criteria)
+
+    order_func = asc if ascending else desc
+    list_stmt = (
+        select(User)
+        .join(User.role)
+        .where(*criteria)
+        .order_by(order_func(_sort_fields[sort_by]))
+        .offset(bindparam("skip", type_=Integer))
+        .limit(bindparam("limit", type_=Integer))
+    )
+    return list_stmt, count_stmt
 
 def get_users(
     db: Session,
@@ -38,40 +95,25 @@ def get_users(
     sort_order: Optional[str] = "desc",
     user_id: Optional[str] = None
 ):
-    query = db.query(User).join(User.role)
-    
-    if user_id:
-        query = query.filter(User.id == user_id)
+    if sort_by not in _sort_fields:
+        sort_by = "created_at"
+    ascending = (sort_order or "").lower() == "asc"
 
-    if search:
-        ilike_value = f"%{search}%"
-        query = query.filter(
-            or_(
-                func.lower(User.email).ilike(func.lower(ilike_value)),
-                func.lower(User.fullname).ilike(func.lower(ilike_value)),
-                func.lower(Role.title).ilike(func.lower(ilike_value)),
-                func.lower(User.status.cast(String)).ilike(func.lower(ilike_value)),
-            )
-        )
-
-    total = query.count() 
-
-    sort_fields = {
-        "fullname": User.fullname,
-        "email": User.email,
-        "created_at": User.created_at,
-        "joined_at": User.joined_at,
-        "status": User.status,
-        "role": Role.title,
-    }
+    list_stmt, count_stmt = _users_list_stmts(bool(search), bool(user_id), sort_by, ascending)
 
-    sort_column = sort_fields.get(sort_by, User.created_at)
-    order_func = asc if sort_order.lower() == "asc" else desc
-    query = query.order_by(order_func(sort_column))
+    params = {"skip": skip, "limit": limit}
+    if user_id:
+        params["user_id"] = user_id
+    if search:
+        params["search"] = f"%{search}%"
 
-    users = query.offset(skip).limit(limit).all()
+    total = db.scalar(count_stmt, params)
+    users = db.scalars(list_stmt, params).all()
     return users, total
 
 def delete_user(db: Session, user: User):
+    user_id = user.id
     db.delete(user)
     db.commit()
+    user_index.remove(user_id)
+    change_hub.publish(user_deleted_event(user_id))
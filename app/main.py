@@ -1,14 +1,51 @@
 from app.api import roles, users, auth
-from app.core.database import Base, engine
+from app.core.database import Base, SessionLocal, engine
+from app.core.user_index import USER_INDEX_REFRESH_SECONDS, user_index
 from app.models import role
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+def rebuild_user_index():
+    db = SessionLocal()
+    try:
+        user_index.build(db)
+    finally:
+        db.close()
+
+async def refresh_user_index():
+    # Other workers' writes never reach this process's index, so rebuild it
+    # periodically to bound how stale it can get.
+    while True:
+        await asyncio.sleep(USER_INDEX_REFRESH_SECONDS)
+        try:
+            await asyncio.to_thread(rebuild_user_index)
+        except Exception:
+            logger.exception("User index refresh failed")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    rebuild_user_index()
+    refresher = None
+    if USER_INDEX_REFRESH_SECONDS > 0:
+        refresher = asyncio.create_task(refresh_user_index())
+    yield
+    if refresher:
+        refresher.cancel()
+        try:
+            await refresher
+        except asyncio.CancelledError:
+            pass
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
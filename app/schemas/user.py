@@ -1,7 +1,7 @@
 from app.models.user import UserStatus
 from app.schemas.role import RoleReadBase, RoleReadRelation
+from app.utils.emails.validation import validate_email_syntax
 from datetime import datetime
-from email_validator import validate_email, EmailNotValidError
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from uuid import UUID
@@ -17,11 +17,7 @@ class UserBase(BaseModel):
             raise ValueError("Email must be at least 2 characters long")
         if len(v) > 255:
             raise ValueError("Email must not exceed 255 characters")
-        try:
-            validate_email(v)
-        except EmailNotValidError:
-            raise ValueError("Please provide a valid email address")
-        return v
+        return validate_email_syntax(v)
 
     @field_validator("fullname")
     def validate_fullname(cls, v: str) -> str:
@@ -56,6 +52,11 @@ class UserReadDetails(UserReadBase):
 class UserReadList(UserReadBase):
     role: RoleReadBase
 
+class UserSuggestion(BaseModel):
+    id: UUID
+    email: str
+    fullname: str
+
 class UserSelfUpdate(BaseModel):
     email: Optional[str] = None
     fullname: Optional[str] = None
@@ -66,11 +67,7 @@ class UserSelfUpdate(BaseModel):
             raise ValueError("Email must be at least 2 characters long")
         if len(v) > 255:
             raise ValueError("Email must not exceed 255 characters")
-        try:
-            validate_email(v)
-        except EmailNotValidError:
-            raise ValueError("Please provide a valid email address")
-        return v
+        return validate_email_syntax(v)
 
     @field_validator("fullname")
     def validate_fullname(cls, v: str) -> str:
@@ -0,0 +1,142 @@
+from collections import OrderedDict
+from email_validator import validate_email, EmailNotValidError
+from threading import Lock
+from typing import Iterable, List, Optional
+import asyncio
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+import os
+import time
+
+EMAIL_VALIDATION_SYNTAX = "syntax"
+EMAIL_VALIDATION_DELIVERABILITY = "deliverability"
+
+EMAIL_VALIDATION_MODE = os.getenv("EMAIL_VALIDATION_MODE", EMAIL_VALIDATION_SYNTAX).lower()
+if EMAIL_VALIDATION_MODE not in (EMAIL_VALIDATION_SYNTAX, EMAIL_VALIDATION_DELIVERABILITY):
+    raise RuntimeError(
+        f"Invalid EMAIL_VALIDATION_MODE {EMAIL_VALIDATION_MODE!r}; "
+        f"expected {EMAIL_VALIDATION_SYNTAX!r} or {EMAIL_VALIDATION_DELIVERABILITY!r}"
+    )
+EMAIL_DNS_TIMEOUT = float(os.getenv("EMAIL_DNS_TIMEOUT", "2.0"))
+EMAIL_DOMAIN_CACHE_SIZE = int(os.getenv("EMAIL_DOMAIN_CACHE_SIZE", "1024"))
+EMAIL_DOMAIN_CACHE_TTL = float(os.getenv("EMAIL_DOMAIN_CACHE_TTL", "3600"))
+
+class DomainCache:
+    """LRU cache of domain deliverability results with a per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, domain: str) -> Optional[bool]:
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                return None
+            deliverable, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[domain]
+                return None
+            self._entries.move_to_end(domain)
+            return deliverable
+
+    def set(self, domain: str, deliverable: bool) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[domain] = (deliverable, time.monotonic() + self.ttl)
+            self._entries.move_to_end(domain)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+domain_cache = DomainCache(EMAIL_DOMAIN_CACHE_SIZE, EMAIL_DOMAIN_CACHE_TTL)
+
+def deliverability_enabled() -> bool:
+    return EMAIL_VALIDATION_MODE == EMAIL_VALIDATION_DELIVERABILITY
+
+def validate_email_syntax(email: str) -> str:
+    """Check the address syntax only; never touches the network."""
+    try:
+        validate_email(email, check_deliverability=False)
+    except EmailNotValidError:
+        raise ValueError("Please provide a valid email address")
+    return email
+
+def email_domain(email: str) -> str:
+    return email.rsplit("@", 1)[-1].strip().lower()
+
+async def _resolve_domain(resolver: dns.asyncresolver.Resolver, domain: str) -> Optional[bool]:
+    # Mirrors email_validator: an MX record (other than a null MX) or,
+    # failing that, an A/AAAA record makes the domain deliverable.
+    # Returns None when the lookup could not give a definite answer.
+    try:
+        answer = await resolver.resolve(domain, "MX")
+        return any(str(record.exchange) != "." for record in answer)
+    except dns.resolver.NXDOMAIN:
+        return False
+    except dns.resolver.NoAnswer:
+        pass
+    except dns.exception.DNSException:
+        return None
+
+    for record_type in ("A", "AAAA"):
+        try:
+            await resolver.resolve(domain, record_type)
+            return True
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            continue
+        except dns.exception.DNSException:
+            return None
+    return False
+
+async def _resolve_domains(domains: List[str]) -> List[Optional[bool]]:
+    try:
+        resolver = dns.asyncresolver.Resolver()
+    except dns.exception.DNSException:
+        # e.g. NoResolverConfiguration when /etc/resolv.conf is missing.
+        return [None] * len(domains)
+    resolver.lifetime = EMAIL_DNS_TIMEOUT
+
+    # The MX and A/AAAA fallbacks each get the resolver lifetime, so bound
+    # the whole batch as well.
+    try:
+        return await asyncio.wait_for(
+            asyncio.gather(*(_resolve_domain(resolver, d) for d in domains)),
+            EMAIL_DNS_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        return [None] * len(domains)
+
+async def check_domains_deliverable(domains: Iterable[str]) -> List[str]:
+    """Resolve each distinct domain once and return the undeliverable ones.
+
+    Domains whose lookup fails or does not finish within EMAIL_DNS_TIMEOUT
+    are treated as deliverable and are not cached, so a slow or broken
+    resolver never rejects or stalls a request.
+    """
+    pending = []
+    undeliverable = []
+    for domain in dict.fromkeys(d.lower() for d in domains):
+        cached = domain_cache.get(domain)
+        if cached is None:
+            pending.append(domain)
+        elif not cached:
+            undeliverable.append(domain)
+
+    if pending:
+        results = await _resolve_domains(pending)
+        for domain, deliverable in zip(pending, results):
+            if deliverable is None:
+                continue
+            domain_cache.set(domain, deliverable)
+            if not deliverable:
+                undeliverable.append(domain)
+
+    return undeliverable
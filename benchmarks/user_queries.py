@@ -0,0 +1,85 @@
+"""Per-call Python overhead of the hot user lookups, before and after.
+
+Runs against an in-memory SQLite database so the numbers reflect statement
+construction and compilation rather than network or server time.
+
+    python -m benchmarks.user_queries
+"""
+from app.core.database import Base, DB_QUERY_CACHE_SIZE
+from app.crud import user as crud_user
+from app.models.role import Role
+from app.models.user import User, UserStatus
+from datetime import datetime
+from sqlalchemy import create_engine, or_, func, String, desc
+from sqlalchemy.orm import sessionmaker
+import timeit
+import uuid
+
+ITERATIONS = 5000
+
+def legacy_get_user(db, user_id):
+    return db.query(User).filter(User.id == user_id).first()
+
+def legacy_get_active_user_by_email(db, email):
+    return db.query(User).filter(User.email == email, User.status == 'ACTIVE').first()
+
+def legacy_get_users(db, search):
+    query = db.query(User).join(User.role)
+    ilike_value = f"%{search}%"
+    query = query.filter(
+        or_(
+            func.lower(User.email).ilike(func.lower(ilike_value)),
+            func.lower(User.fullname).ilike(func.lower(ilike_value)),
+            func.lower(Role.title).ilike(func.lower(ilike_value)),
+            func.lower(User.status.cast(String)).ilike(func.lower(ilike_value)),
+        )
+    )
+    total = query.count()
+    users = query.order_by(desc(User.created_at)).offset(0).limit(10).all()
+    return users, total
+
+def setup_session():
+    engine = create_engine("sqlite://", query_cache_size=DB_QUERY_CACHE_SIZE)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    role = Role(id=uuid.uuid4(), title="Admin", permission=["view:users"], created_at=datetime.utcnow())
+    user = User(
+        id=uuid.uuid4(),
+        email="bench@example.com",
+        fullname="Bench User",
+        role=role,
+        status=UserStatus.ACTIVE,
+        created_at=datetime.utcnow(),
+    )
+    db.add_all([role, user])
+    db.commit()
+    return db, user.id
+
+def report(name, before, after):
+    per_call_before = before / ITERATIONS * 1e6
+    per_call_after = after / ITERATIONS * 1e6
+    print(f"{name:<26} before {per_call_before:8.1f} us  after {per_call_after:8.1f} us  "
+          f"({per_call_before / per_call_after:.2f}x)")
+
+def main():
+    db, user_id = setup_session()
+    cases = [
+        ("get_user",
+         lambda: legacy_get_user(db, user_id),
+         lambda: crud_user.get_user(db, user_id)),
+        ("get_active_user_by_email",
+         lambda: legacy_get_active_user_by_email(db, "bench@example.com"),
+         lambda: crud_user.get_active_user_by_email(db, "bench@example.com")),
+        ("get_users(search=...)",
+         lambda: legacy_get_users(db, "bench"),
+         lambda: crud_user.get_users(db, search="bench")),
+    ]
+    for name, before, after in cases:
+        # Warm both paths so the compiled cache is populated first.
+        before()
+        after()
+        report(name, timeit.timeit(before, number=ITERATIONS), timeit.timeit(after, number=ITERATIONS))
+
+if __name__ == "__main__":
+    main()